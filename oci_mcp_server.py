@@ -12,18 +12,26 @@ from __future__ import annotations
 
 import os
 import json
+import asyncio
+import functools
+import ipaddress
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from urllib.request import Request, urlopen
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 from dotenv import load_dotenv
 
 # MCP (official Python SDK)
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 # OCI SDK
 import oci
-from oci.util import to_dict
 
 # ---------- Logging & env ----------
 load_dotenv()
@@ -31,14 +39,58 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 log = logging.getLogger("oci-mcp")
 
+# Shared pool for fanning out independent, blocking OCI calls.
+# 10 workers bounds the burst sent to OCI (keeping fan-out clear of API throttling)
+# while staying well inside each client's widened HTTPS pool.
+_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="oci-mcp")
+# Separate pool for page prefetching: list calls may already be running on _executor,
+# and waiting on a page from the same pool could exhaust it.
+_page_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="oci-mcp-page")
+
 # ---------- OCI helper ----------
 
+# Service alias -> canonical name (clients are cached per canonical name)
+_SERVICE_ALIASES: Dict[str, str] = {
+    "identity": "identity", "iam": "identity",
+    "compute": "compute", "core": "compute",
+    "network": "network", "virtualnetwork": "network", "vcn": "network",
+    "database": "database", "db": "database",
+    "object_storage": "object_storage", "objectstorage": "object_storage", "os": "object_storage",
+    "usage_api": "usage_api", "usage": "usage_api", "cost": "usage_api",
+}
+# Canonical name -> client class (Usage API is resolved lazily since older SDKs don't ship it)
+_SERVICE_DISPATCH: Dict[str, Callable[..., Any]] = {
+    "identity": oci.identity.IdentityClient,
+    "compute": oci.core.ComputeClient,
+    "network": oci.core.VirtualNetworkClient,
+    "database": oci.database.DatabaseClient,
+    "object_storage": oci.object_storage.ObjectStorageClient,
+}
+
+_METADATA_URL = "http://169.254.169.254/opc/v2/instance/"
+
+# Shared backoff for every SDK call: throttling (429) and 5xx are retried.
+# More attempts than the SDK default since parallel fan-out hits rate limits harder.
+_RETRY_STRATEGY = oci.retry.RetryStrategyBuilder(
+    max_attempts_check=True,
+    max_attempts=10,
+    retry_max_wait_between_calls_seconds=30,
+    retry_base_sleep_time_seconds=1,
+    service_error_check=True,
+    service_error_retry_config={429: [], 500: []},
+    service_error_retry_on_any_5xx=True,
+).get_retry_strategy()
+
 class OCIManager:
     """Simple manager to create OCI clients using ~/.oci/config or env-based auth."""
 
     def __init__(self) -> None:
-        self.config = self._load_config()
         self.signer = None  # for instance principals etc.
+        self._metadata: Optional[Dict[str, Any]] = None
+        self.config = self._load_config()
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+        self._namespace: Optional[str] = None
 
     def _load_config(self) -> Dict[str, Any]:
         # Prefer config file if present
@@ -64,54 +116,282 @@ class OCIManager:
         # Finally, try instance principals (for servers running on OCI)
         try:
             self.signer = oci.auth.signers.get_resource_principals_signer()
-            region = os.getenv("OCI_REGION", "ap-melbourne-1")
-            cfg = {"region": region, "tenancy": os.getenv("OCI_TENANCY_OCID", "")}
-            log.info("Using instance/resource principals signer")
-            return cfg
         except Exception:
             raise RuntimeError(
                 "No OCI credentials found. Run `oci setup config` or set env vars "
                 "(OCI_USER_OCID, OCI_FINGERPRINT, OCI_TENANCY_OCID, OCI_REGION, OCI_KEY_FILE)."
             )
+        region = os.getenv("OCI_REGION", "ap-melbourne-1")
+        cfg = {"region": region, "tenancy": os.getenv("OCI_TENANCY_OCID", "")}
+        # No tenancy configured; fall back to the instance metadata service. The instance's
+        # own compartment then becomes the default scope (only in this case, so an explicit
+        # OCI_TENANCY_OCID keeps tenancy-wide defaults).
+        if not cfg["tenancy"]:
+            meta = self.instance_metadata()
+            cfg["tenancy"] = meta.get("tenantId", "")
+            if meta.get("compartmentId"):
+                cfg["compartment_id"] = meta["compartmentId"]
+        log.info("Using instance/resource principals signer")
+        return cfg
+
+    def instance_metadata(self) -> Dict[str, Any]:
+        """OCI instance metadata (stable for the VM's lifetime); empty when not running on OCI."""
+        if self._metadata is None:
+            req = Request(_METADATA_URL, headers={"Authorization": "Bearer Oracle"})
+            try:
+                with urlopen(req, timeout=5) as resp:
+                    self._metadata = json.load(resp)
+            except Exception as e:
+                log.warning(f"Could not read OCI instance metadata: {e}")
+                self._metadata = {}
+        return self._metadata
 
     def get_client(self, service: str):
-        """Return an OCI service client bound to configured region/signer."""
-        service = service.lower()
-        kwargs = {}
+        """Return a cached OCI service client bound to configured region/signer."""
+        name = _SERVICE_ALIASES.get(service.lower())
+        if name is None:
+            raise ValueError(f"Unknown OCI service: {service}")
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+        with self._clients_lock:
+            client = self._clients.get(name)
+            if client is None:
+                client = self._create_client(name)
+                self._widen_connection_pool(client)
+                self._clients[name] = client
+        return client
+
+    def get_namespace(self) -> str:
+        """Object Storage namespace of the tenancy (immutable, so fetched once)."""
+        if self._namespace is None:
+            self._namespace = self.get_client("object_storage").get_namespace().data
+        return self._namespace
+
+    @staticmethod
+    def _widen_connection_pool(client: Any) -> None:
+        # Raise the HTTPS pool ceiling so concurrent fan-out reuses connections.
+        # Keep the SDK's own adapter class, which carries OCI-specific transport behavior.
+        session = client.base_client.session
+        adapter_cls = type(session.get_adapter("https://"))
+        session.mount("https://", adapter_cls(pool_connections=20, pool_maxsize=50))
+
+    def _create_client(self, service: str):
+        kwargs: Dict[str, Any] = {"retry_strategy": _RETRY_STRATEGY}
         if self.signer:
             kwargs["signer"] = self.signer
 
-        if service in ("identity", "iam"):
-            return oci.identity.IdentityClient(self.config, **kwargs)
-        if service in ("compute", "core"):
-            return oci.core.ComputeClient(self.config, **kwargs)
-        if service in ("network", "virtualnetwork", "vcn"):
-            return oci.core.VirtualNetworkClient(self.config, **kwargs)
-        if service in ("database", "db"):
-            return oci.database.DatabaseClient(self.config, **kwargs)
-        if service in ("object_storage", "objectstorage", "os"):
-            return oci.object_storage.ObjectStorageClient(self.config, **kwargs)
-        if service in ("usage", "usage_api", "cost"):
+        if service == "usage_api":
             try:
                 return oci.usage_api.UsageapiClient(self.config, **kwargs)  # type: ignore[attr-defined]
             except Exception as e:
                 raise RuntimeError("Usage API client not available; check OCI SDK version.") from e
-
-        raise ValueError(f"Unknown OCI service: {service}")
+        return _SERVICE_DISPATCH[service](self.config, **kwargs)
 
 
 oci_manager = OCIManager()
 
-# Utility: default compartment
+# Utility: default compartment (resolved once; env and config don't change at runtime)
+_DEFAULT_COMPARTMENT: Optional[str] = (os.getenv("DEFAULT_COMPARTMENT_OCID")
+                                       or oci_manager.config.get("compartment_id")
+                                       or oci_manager.config.get("tenancy"))
+
 def _default_compartment() -> Optional[str]:
-    return os.getenv("DEFAULT_COMPARTMENT_OCID") or oci_manager.config.get("tenancy")
+    return _DEFAULT_COMPARTMENT
+
+def _set_default_compartment(compartment_ocid: Optional[str]) -> None:
+    """Override the default compartment (e.g., in tests)."""
+    global _DEFAULT_COMPARTMENT
+    _DEFAULT_COMPARTMENT = compartment_ocid
 
 # Utility: safe dict conversion for OCI models/collections
 def _to_clean_dict(x: Any) -> Any:
-    try:
-        return to_dict(x)
-    except Exception:
-        return json.loads(json.dumps(x, default=str))
+    if x is None or isinstance(x, (str, int, float, bool)):
+        return x
+    if isinstance(x, datetime):
+        return (x if x.tzinfo else x.replace(tzinfo=timezone.utc)).isoformat()
+    if isinstance(x, date):
+        return x.isoformat()
+    if isinstance(x, dict):
+        return {k: _to_clean_dict(v) for k, v in x.items()}
+    if isinstance(x, (list, tuple, set)):
+        return [_to_clean_dict(v) for v in x]
+    if hasattr(x, "swagger_types"):  # OCI model
+        return {k: _to_clean_dict(getattr(x, k)) for k in x.swagger_types}
+    return str(x)
+
+_iso = datetime.isoformat
+
+# Compact response items for the list tools (FastMCP/pydantic serialize dataclasses natively)
+@dataclass(slots=True, frozen=True)
+class InstanceSummary:
+    id: str
+    display_name: Optional[str]
+    shape: Optional[str]
+    lifecycle_state: Optional[str]
+    time_created: Optional[str]
+    compartment_id: Optional[str]
+    availability_domain: Optional[str]
+
+@dataclass(slots=True, frozen=True)
+class ADBSummary:
+    id: str
+    db_name: Optional[str]
+    display_name: Optional[str]
+    lifecycle_state: Optional[str]
+    db_workload: Optional[str]
+    cpu_core_count: Optional[int]
+    data_storage_size_in_tbs: Optional[int]
+    is_auto_scaling_enabled: Optional[bool]
+    connection_strings: Optional[Dict[str, Any]]
+
+@dataclass(slots=True, frozen=True)
+class BucketSummary:
+    name: str
+    created: Optional[str]
+    namespace: str
+
+@dataclass(slots=True, frozen=True)
+class CompartmentSummary:
+    id: str
+    name: Optional[str]
+    lifecycle_state: Optional[str]
+    is_accessible: Optional[bool]
+
+T = TypeVar("T")
+
+@dataclass(slots=True, frozen=True)
+class ListResult(Generic[T]):
+    items: List[T]
+    truncated: bool  # True when more results exist beyond max_results
+
+def _instance_summary(inst: Any) -> InstanceSummary:
+    return InstanceSummary(
+        inst.id,
+        inst.display_name,
+        inst.shape,
+        inst.lifecycle_state,
+        _iso(inst.time_created) if inst.time_created else None,
+        inst.compartment_id,
+        inst.availability_domain,
+    )
+
+def _adb_summary(adb: Any) -> ADBSummary:
+    return ADBSummary(
+        adb.id,
+        adb.db_name,
+        adb.display_name,
+        adb.lifecycle_state,
+        adb.db_workload,
+        adb.cpu_core_count,
+        adb.data_storage_size_in_tbs,
+        adb.is_auto_scaling_enabled,
+        _to_clean_dict(adb.connection_strings),
+    )
+
+
+# Utility: stream paginated list results page-by-page
+def _page_items(data: Any) -> List[Any]:
+    if isinstance(data, list):
+        return data
+    items = getattr(data, "items", None)
+    if items is None:
+        items = getattr(data, "resources", None)  # identity domains collections
+    return items or []
+
+def _next_page_kwargs(resp: Any) -> Optional[Dict[str, Any]]:
+    return {"page": resp.next_page} if resp.next_page is not None else None
+
+def _iter_pages(list_func, should_prefetch: Optional[Callable[[Any], bool]] = None, **kwargs: Any):
+    """Yield list responses, requesting the next page while the caller consumes the current one.
+
+    Page tokens are opaque, so pages can't be fetched out of order; instead the next
+    round-trip is started as soon as its token is known and overlaps the caller's work.
+    should_prefetch(resp) lets a caller that may stop after resp skip that early request.
+    """
+    # Retries/backoff come from the client-level _RETRY_STRATEGY
+    resp = list_func(**kwargs)
+    while True:
+        cursor = _next_page_kwargs(resp)
+        if cursor is None:
+            yield resp
+            return
+        prefetch = should_prefetch is None or should_prefetch(resp)
+        pending = _page_executor.submit(list_func, **{**kwargs, **cursor}) if prefetch else None
+        yield resp
+        resp = pending.result() if pending is not None else list_func(**{**kwargs, **cursor})
+
+def _iter_all(list_func, **kwargs: Any):
+    """Yield records from every page without buffering the whole result set."""
+    for resp in _iter_pages(list_func, **kwargs):
+        yield from _page_items(resp.data)
+
+# Page size accepted by every list API used here; larger caps rely on the service default
+_SMALL_PAGE_LIMIT = 100
+
+def _collect(list_func, build: Callable[[Any], T], max_results: Optional[int],
+             ctx: Optional[Context] = None, **kwargs: Any) -> ListResult[T]:
+    """Build items page-by-page, stopping once max_results items have been collected."""
+    if max_results is not None and max_results < 1:
+        raise ValueError(f"Invalid max_results {max_results}; must be at least 1 (or None for no cap)")
+    if max_results is not None and max_results <= _SMALL_PAGE_LIMIT:
+        kwargs.setdefault("limit", max_results)
+    items: List[T] = []
+
+    def _needs_more_after(page: Any) -> bool:
+        return max_results is None or len(items) + len(_page_items(page.data)) < max_results
+
+    for page in _iter_pages(list_func, should_prefetch=_needs_more_after, **kwargs):
+        for record in _page_items(page.data):
+            if max_results is not None and len(items) >= max_results:
+                return ListResult(items, truncated=True)
+            items.append(build(record))
+        _report_progress(ctx, len(items))
+        if max_results is not None and len(items) >= max_results:
+            # Cap reached on a page boundary: the next-page token alone says whether more exist
+            return ListResult(items, truncated=_next_page_kwargs(page) is not None)
+    return ListResult(items, truncated=False)
+
+
+# Utility: short-lived cache for slow, rarely-changing reads
+_CACHE_TTL_SECONDS = 300
+_CACHE_MAXSIZE = 64
+_cache: Dict[Any, Any] = {}
+_cache_lock = threading.Lock()
+
+def _ttl_cached(fn):
+    """Memoize a read-only tool body for _CACHE_TTL_SECONDS, keyed on its name and arguments."""
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        hit = _cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _CACHE_TTL_SECONDS:
+            return hit[1]
+        value = fn(*args, **kwargs)
+        with _cache_lock:
+            _cache.pop(key, None)
+            if len(_cache) >= _CACHE_MAXSIZE:
+                _cache.pop(next(iter(_cache)))
+            _cache[key] = (time.monotonic(), value)
+        return value
+    return wrapper
+
+
+# Utility: run a blocking tool body off the event loop
+_tool_loop: ContextVar[asyncio.AbstractEventLoop] = ContextVar("_tool_loop")
+
+def _offload(fn):
+    """Expose a blocking (OCI SDK) tool as a coroutine so concurrent calls don't stall the loop."""
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        _tool_loop.set(asyncio.get_running_loop())  # copied into the worker thread by to_thread
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return wrapper
+
+def _report_progress(ctx: Optional[Context], progress: float, total: Optional[float] = None) -> None:
+    """Send an MCP progress notification from an offloaded tool body (no-op without a context)."""
+    if ctx is not None:
+        asyncio.run_coroutine_threadsafe(ctx.report_progress(progress, total), _tool_loop.get())
 
 
 # ---------- MCP server ----------
@@ -119,37 +399,30 @@ def _to_clean_dict(x: Any) -> Any:
 mcp = FastMCP("oci-mcp-server")
 
 @mcp.tool()
+@_offload
 def list_compute_instances(compartment_ocid: Optional[str] = None,
-                           lifecycle_state: Optional[str] = None) -> List[Dict[str, Any]]:
+                           lifecycle_state: Optional[str] = None,
+                           max_results: Optional[int] = 1000,
+                           ctx: Optional[Context] = None) -> ListResult[InstanceSummary]:
     """List Compute instances.
     Args:
-        compartment_ocid: Compartment OCID (defaults to tenancy if omitted)
+        compartment_ocid: Compartment OCID (defaults to DEFAULT_COMPARTMENT_OCID, else the tenancy;
+            under instance principals with no tenancy configured, the instance's compartment)
         lifecycle_state: Optional filter (e.g., RUNNING, STOPPED)
+        max_results: Stop after this many instances (None for no cap)
     Returns:
-        Array of instance summaries (OCID, display_name, shape, lifecycle_state, time_created)
+        Instance summaries (OCID, display_name, shape, lifecycle_state, time_created) and a truncated flag
     """
     comp = compartment_ocid or _default_compartment()
     assert comp, "No compartment OCID available"
     compute = oci_manager.get_client("compute")
-    items = []
-    for inst in oci.pagination.list_call_get_all_results(
-        compute.list_instances, compartment_id=comp
-    ).data:
-        if lifecycle_state and inst.lifecycle_state != lifecycle_state:
-            continue
-        items.append({
-            "id": inst.id,
-            "display_name": inst.display_name,
-            "shape": inst.shape,
-            "lifecycle_state": inst.lifecycle_state,
-            "time_created": inst.time_created.isoformat() if inst.time_created else None,
-            "compartment_id": inst.compartment_id,
-            "availability_domain": getattr(inst, "availability_domain", None),
-        })
-    return items
+    filters = {"lifecycle_state": lifecycle_state.upper()} if lifecycle_state else {}
+    return _collect(compute.list_instances, _instance_summary, max_results, ctx,
+                    compartment_id=comp, **filters)
 
 
 @mcp.tool()
+@_offload
 def get_instance_details(instance_id: str) -> Dict[str, Any]:
     """Get detailed info for a Compute instance, including VNICs and public IPs.
     Args:
@@ -164,21 +437,20 @@ def get_instance_details(instance_id: str) -> Dict[str, Any]:
         "display_name": inst.display_name,
         "shape": inst.shape,
         "lifecycle_state": inst.lifecycle_state,
-        "time_created": inst.time_created.isoformat() if inst.time_created else None,
+        "time_created": _iso(inst.time_created) if inst.time_created else None,
         "metadata": inst.metadata,
         "extended_metadata": inst.extended_metadata,
     }
 
     # VNIC attachments -> VNICs
-    attachments = oci.pagination.list_call_get_all_results(
+    attachments = _iter_all(
         compute.list_vnic_attachments,
         compartment_id=inst.compartment_id,
         instance_id=inst.id,
-    ).data
+    )
 
     vnics = []
-    for att in attachments:
-        vnic = vcn.get_vnic(att.vnic_id).data
+    for vnic in _executor.map(lambda att: vcn.get_vnic(att.vnic_id).data, attachments):
         vnics.append({
             "id": vnic.id,
             "display_name": vnic.display_name,
@@ -192,7 +464,11 @@ def get_instance_details(instance_id: str) -> Dict[str, Any]:
     return details
 
 
+_VALID_ACTIONS = frozenset({"START", "STOP", "RESET", "SOFTRESET", "SOFTSTOP"})
+
+
 @mcp.tool()
+@_offload
 def instance_action(instance_id: str, action: str) -> Dict[str, Any]:
     """Perform a safe instance action (START, STOP, RESET, SOFTRESET, SOFTSTOP).
     Args:
@@ -201,66 +477,96 @@ def instance_action(instance_id: str, action: str) -> Dict[str, Any]:
     """
     compute = oci_manager.get_client("compute")
     action = action.upper()
-    valid = {"START","STOP","RESET","SOFTRESET","SOFTSTOP"}
-    if action not in valid:
-        raise ValueError(f"Invalid action '{action}'. Allowed: {sorted(valid)}")
+    if action not in _VALID_ACTIONS:
+        raise ValueError(f"Invalid action '{action}'. Allowed: {sorted(_VALID_ACTIONS)}")
     resp = compute.instance_action(instance_id=instance_id, action=action)
     return {"status": resp.status, "headers": dict(resp.headers)}
 
 
 @mcp.tool()
-def list_autonomous_databases(compartment_ocid: Optional[str] = None) -> List[Dict[str, Any]]:
-    """List Autonomous Databases in a compartment (defaults to tenancy)."""
+@_offload
+def list_autonomous_databases(compartment_ocid: Optional[str] = None,
+                              max_results: Optional[int] = 1000) -> ListResult[ADBSummary]:
+    """List Autonomous Databases in a compartment.
+    Args:
+        compartment_ocid: Compartment OCID (defaults to DEFAULT_COMPARTMENT_OCID, else the tenancy;
+            under instance principals with no tenancy configured, the instance's compartment)
+        max_results: Stop after this many databases (None for no cap)
+    """
     comp = compartment_ocid or _default_compartment()
     assert comp, "No compartment OCID available"
     db = oci_manager.get_client("database")
-    items = []
-    for adb in oci.pagination.list_call_get_all_results(
-        db.list_autonomous_databases, compartment_id=comp
-    ).data:
-        items.append({
-            "id": adb.id,
-            "db_name": adb.db_name,
-            "display_name": adb.display_name,
-            "lifecycle_state": adb.lifecycle_state,
-            "db_workload": adb.db_workload,
-            "cpu_core_count": getattr(adb, "cpu_core_count", None),
-            "data_storage_size_in_tbs": getattr(adb, "data_storage_size_in_tbs", None),
-            "is_auto_scaling_enabled": getattr(adb, "is_auto_scaling_enabled", None),
-            "connection_strings": _to_clean_dict(getattr(adb, "connection_strings", {})),
-        })
-    return items
+    return _collect(db.list_autonomous_databases, _adb_summary, max_results, compartment_id=comp)
 
 
 @mcp.tool()
-def list_storage_buckets(compartment_ocid: Optional[str] = None) -> List[Dict[str, Any]]:
-    """List Object Storage buckets in the configured region for the given compartment."""
+@_offload
+def list_storage_buckets(compartment_ocid: Optional[str] = None,
+                         max_results: Optional[int] = 1000,
+                         ctx: Optional[Context] = None) -> ListResult[BucketSummary]:
+    """List Object Storage buckets in the configured region for the given compartment.
+    Args:
+        compartment_ocid: Compartment OCID (defaults to DEFAULT_COMPARTMENT_OCID, else the tenancy;
+            under instance principals with no tenancy configured, the instance's compartment)
+        max_results: Stop after this many buckets (None for no cap)
+    """
     comp = compartment_ocid or _default_compartment()
     assert comp, "No compartment OCID available"
     osvc = oci_manager.get_client("object_storage")
-    namespace = osvc.get_namespace().data
-    buckets = oci.pagination.list_call_get_all_results(
-        osvc.list_buckets, namespace_name=namespace, compartment_id=comp
-    ).data
-    return [{"name": b.name, "created": b.time_created.isoformat(), "namespace": namespace} for b in buckets]
+    namespace = oci_manager.get_namespace()
+    return _collect(
+        osvc.list_buckets,
+        lambda b: BucketSummary(b.name, _iso(b.time_created) if b.time_created else None, namespace),
+        max_results, ctx,
+        namespace_name=namespace, compartment_id=comp,
+    )
 
 
 @mcp.tool()
-def list_compartments() -> List[Dict[str, Any]]:
-    """List accessible compartments in the tenancy (including subtrees)."""
+@_offload
+@_ttl_cached
+def list_compartments(max_results: Optional[int] = 1000) -> ListResult[CompartmentSummary]:
+    """List accessible compartments in the tenancy (including subtrees).
+    Args:
+        max_results: Stop after this many compartments (None for no cap)
+    """
     identity = oci_manager.get_client("identity")
     tenancy_id = oci_manager.config["tenancy"]
-    comps = oci.pagination.list_call_get_all_results(
+    return _collect(
         identity.list_compartments,
+        lambda c: CompartmentSummary(c.id, c.name, c.lifecycle_state, c.is_accessible),
+        max_results,
         compartment_id=tenancy_id,
         compartment_id_in_subtree=True,
         access_level="ACCESSIBLE",
-    ).data
-    return [{"id": c.id, "name": c.name, "lifecycle_state": c.lifecycle_state, "is_accessible": c.is_accessible} for c in comps]
+    )
+
+
+# Sources whose CIDR covers this much address space (e.g. 0.0.0.0/0, 0.0.0.0/1, ::/0) count as
+# wide open, unless they sit inside private space (10.0.0.0/8 is an internal-only range)
+_WIDE_PREFIXLEN = 8
+_PRIVATE_V4 = tuple(ipaddress.IPv4Network(n) for n in ("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16"))
+_PRIVATE_V6 = (ipaddress.IPv6Network("fc00::/7"),)
+
+@functools.lru_cache(maxsize=1024)
+def _is_wide(source: Optional[str]) -> bool:
+    if source is None:
+        return False
+    try:
+        net = ipaddress.ip_network(source, strict=False)
+    except ValueError:  # NSG OCIDs, service CIDR labels
+        return False
+    if net.prefixlen > _WIDE_PREFIXLEN:
+        return False
+    if isinstance(net, ipaddress.IPv4Network):
+        return not any(net.subnet_of(p) for p in _PRIVATE_V4)
+    return not any(net.subnet_of(p) for p in _PRIVATE_V6)
 
 
 @mcp.tool()
-def perform_security_assessment(compartment_ocid: Optional[str] = None) -> Dict[str, Any]:
+@_offload
+def perform_security_assessment(compartment_ocid: Optional[str] = None,
+                                ctx: Optional[Context] = None) -> Dict[str, Any]:
     """Basic security posture checks (public IPs, wide-open rules). Read-only heuristics."""
     comp = compartment_ocid or _default_compartment()
     assert comp, "No compartment OCID available"
@@ -271,37 +577,63 @@ def perform_security_assessment(compartment_ocid: Optional[str] = None) -> Dict[
     findings: Dict[str, Any] = {"public_instances": [], "wide_open_nsg_rules": [], "wide_open_sec_list_rules": []}
 
     # Instances with public IPs
-    for inst in oci.pagination.list_call_get_all_results(compute.list_instances, compartment_id=comp).data:
-        vnic_atts = oci.pagination.list_call_get_all_results(
-            compute.list_vnic_attachments, compartment_id=comp, instance_id=inst.id
-        ).data
-        for att in vnic_atts:
-            vnic = net.get_vnic(att.vnic_id).data
-            if vnic.public_ip:
-                findings["public_instances"].append({"instance_id": inst.id, "name": inst.display_name, "public_ip": vnic.public_ip})
-
-    # Security Lists allowing 0.0.0.0/0 inbound
-    for vcn in oci.pagination.list_call_get_all_results(net.list_vcns, compartment_id=comp).data:
-        sec_lists = oci.pagination.list_call_get_all_results(net.list_security_lists, compartment_id=comp, vcn_id=vcn.id).data
+    # One compartment-wide attachment listing instead of one per instance
+    atts_by_instance: Dict[str, List[Any]] = {}
+    for att in _iter_all(compute.list_vnic_attachments, compartment_id=comp):
+        if att.vnic_id:
+            atts_by_instance.setdefault(att.instance_id, []).append(att)
+
+    pairs: List[Tuple[Any, str]] = []
+    for inst in _iter_all(compute.list_instances, compartment_id=comp):
+        pairs.extend((inst, att.vnic_id) for att in atts_by_instance.get(inst.id, ()))
+
+    vnic_ids = list({vnic_id for _, vnic_id in pairs})
+    vnics = dict(zip(vnic_ids, _executor.map(lambda vid: net.get_vnic(vid).data, vnic_ids)))
+    for inst, vnic_id in pairs:
+        vnic = vnics[vnic_id]
+        if vnic.public_ip:
+            findings["public_instances"].append({"instance_id": inst.id, "name": inst.display_name, "public_ip": vnic.public_ip})
+    _report_progress(ctx, 1, 3)
+
+    # Each VCN's security lists and NSGs are independent, so fetch them concurrently
+    def _vcn_rules(vcn):
+        sec_lists = list(_iter_all(net.list_security_lists, compartment_id=comp, vcn_id=vcn.id))
+        nsgs = list(_iter_all(net.list_network_security_groups, compartment_id=comp, vcn_id=vcn.id))
+        return vcn, sec_lists, nsgs
+
+    vcns = _iter_all(net.list_vcns, compartment_id=comp)
+    all_nsgs = []
+    for vcn, sec_lists, nsgs in _executor.map(_vcn_rules, vcns):
+        # Security Lists allowing inbound from wide public CIDRs (see _is_wide)
         for sl in sec_lists:
             for rule in sl.ingress_security_rules or []:
-                src = getattr(rule, "source", "")
-                if src == "0.0.0.0/0":
+                if _is_wide(rule.source):
                     findings["wide_open_sec_list_rules"].append({"security_list_id": sl.id, "vcn": vcn.display_name, "proto": rule.protocol})
+        all_nsgs.extend(nsgs)
+    _report_progress(ctx, 2, 3)
+
+    # NSGs (rules for every NSG across all VCNs in one batch)
+    def _nsg_rules(nsg):
+        return nsg, list(_iter_all(net.list_network_security_group_security_rules, network_security_group_id=nsg.id))
 
-        # NSGs
-        nsgs = oci.pagination.list_call_get_all_results(net.list_network_security_groups, compartment_id=comp, vcn_id=vcn.id).data
-        for nsg in nsgs:
-            rules = oci.pagination.list_call_get_all_results(net.list_network_security_group_security_rules, network_security_group_id=nsg.id).data
-            for r in rules:
-                src = getattr(r, "source", "") or getattr(r, "source_type", "")
-                if getattr(r, "direction", "INGRESS") == "INGRESS" and getattr(r, "source", "") == "0.0.0.0/0":
-                    findings["wide_open_nsg_rules"].append({"nsg_id": nsg.id, "name": nsg.display_name, "proto": r.protocol})
+    for nsg, rules in _executor.map(_nsg_rules, all_nsgs):
+        for r in rules:
+            if r.direction == "INGRESS" and _is_wide(r.source):
+                findings["wide_open_nsg_rules"].append({"nsg_id": nsg.id, "name": nsg.display_name, "proto": r.protocol})
+    _report_progress(ctx, 3, 3)
 
     return findings
 
 
+_COST_SHARD = timedelta(days=7)
+
+def _naive_utc(dt: datetime) -> datetime:
+    """Normalize to naive UTC so parsed offsets and utcnow() defaults can be compared."""
+    return dt.astimezone(timezone.utc).replace(tzinfo=None) if dt.tzinfo else dt
+
+
 @mcp.tool()
+@_offload
 def get_tenancy_cost_summary(start_time_iso: Optional[str] = None,
                              end_time_iso: Optional[str] = None,
                              granularity: str = "DAILY") -> Dict[str, Any]:
@@ -324,29 +656,55 @@ def get_tenancy_cost_summary(start_time_iso: Optional[str] = None,
         start = end - timedelta(days=7)
     else:
         start = datetime.fromisoformat(start_time_iso.replace("Z",""))
+    start, end = _naive_utc(start), _naive_utc(end)
 
     tenant_id = oci_manager.config["tenancy"]
-    details = oci.usage_api.models.RequestSummarizedUsagesDetails(
-        tenant_id=tenant_id,
-        time_usage_started=start,
-        time_usage_ended=end,
-        granularity=granularity,
-        query_type="COST",
-        group_by=["service"],
-        forecast=False,
-    )
-    resp = usage.request_summarized_usages(request_summarized_usages_details=details)
-    rows = [to_dict(x) for x in resp.data.items] if getattr(resp.data, "items", None) else []
+
+    def _summarize(window):
+        details = oci.usage_api.models.RequestSummarizedUsagesDetails(
+            tenant_id=tenant_id,
+            time_usage_started=window[0],
+            time_usage_ended=window[1],
+            granularity=granularity,
+            query_type="COST",
+            group_by=["service"],
+            forecast=False,
+        )
+        resp = usage.request_summarized_usages(request_summarized_usages_details=details)
+        return [_to_clean_dict(x) for x in resp.data.items] if getattr(resp.data, "items", None) else []
+
+    # Long DAILY windows are split into weekly shards queried in parallel
+    windows = [(start, end)]
+    if granularity.upper() == "DAILY" and end - start > _COST_SHARD:
+        windows = []
+        cursor = start
+        while cursor < end:
+            windows.append((cursor, min(cursor + _COST_SHARD, end)))
+            cursor += _COST_SHARD
+
+    if len(windows) == 1:
+        rows = _summarize(windows[0])
+    else:
+        rows = [r for shard in _executor.map(_summarize, windows) for r in shard]
     total = sum((r.get("computed_amount", 0) or 0) for r in rows)
     return {"start": start.isoformat()+"Z", "end": end.isoformat()+"Z", "granularity": granularity, "total_computed_amount": total, "items": rows}
 
 
+@mcp.tool()
+def invalidate_cache() -> Dict[str, Any]:
+    """Drop cached read results (e.g., compartments) so the next call hits OCI again."""
+    with _cache_lock:
+        cleared = len(_cache)
+        _cache.clear()
+    return {"cleared": cleared}
+
+
 # ----------- Resources -----------
 
 @mcp.resource("oci://compartments")
-def resource_compartments() -> Dict[str, Any]:
+async def resource_compartments() -> Dict[str, Any]:
     """Resource listing compartments (id, name)."""
-    return {"compartments": list_compartments()}
+    return {"compartments": (await list_compartments(max_results=None)).items}
 
 
 # ----------- Prompts -----------
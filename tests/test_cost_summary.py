@@ -0,0 +1,42 @@
+from datetime import datetime
+
+from oci.response import Response
+from oci.usage_api.models import UsageSummary, UsageAggregation
+
+import oci_mcp_server as srv
+
+
+class FakeUsage:
+    """Returns one 1.0-cost row per day in the requested window."""
+
+    def __init__(self):
+        self.windows = []
+
+    def request_summarized_usages(self, request_summarized_usages_details):
+        d = request_summarized_usages_details
+        self.windows.append((d.time_usage_started, d.time_usage_ended))
+        days = (d.time_usage_ended - d.time_usage_started).days
+        rows = [UsageSummary(computed_amount=1.0, service="COMPUTE") for _ in range(days)]
+        return Response(200, {}, UsageAggregation(items=rows), None)
+
+
+def _summary(monkeypatch, *args):
+    usage = FakeUsage()
+    monkeypatch.setitem(srv.oci_manager._clients, "usage_api", usage)
+    return usage, srv.get_tenancy_cost_summary.__wrapped__(*args)
+
+
+def test_offset_start_with_default_end(monkeypatch):
+    usage, result = _summary(monkeypatch, "2024-01-01T00:00:00+00:00")
+    assert usage.windows
+    assert all(start.tzinfo is None and end.tzinfo is None for start, end in usage.windows)
+    assert result["start"] == "2024-01-01T00:00:00Z"
+
+
+def test_thirty_day_daily_window_is_sharded(monkeypatch):
+    usage, result = _summary(monkeypatch, "2024-01-01T00:00:00Z", "2024-01-31T00:00:00Z")
+    assert len(usage.windows) == 5
+    assert usage.windows[0][0] == datetime(2024, 1, 1)
+    assert usage.windows[-1][1] == datetime(2024, 1, 31)
+    assert result["total_computed_amount"] == 30.0
+    assert len(result["items"]) == 30
@@ -0,0 +1,57 @@
+import pytest
+from oci.response import Response
+
+import oci_mcp_server as srv
+
+
+class FakeLister:
+    """Serves `total` records in pages of `page_size`, honouring `limit`, and counts calls."""
+
+    def __init__(self, total, page_size):
+        self.total, self.page_size, self.calls = total, page_size, 0
+
+    def __call__(self, page=None, limit=None, **kwargs):
+        self.calls += 1
+        start = int(page or 0)
+        end = min(start + min(limit or self.page_size, self.page_size), self.total)
+        headers = {"opc-next-page": str(end)} if end < self.total else {}
+        return Response(200, headers, list(range(start, end)), None)
+
+
+def test_cap_inside_first_page_makes_one_call():
+    lister = FakeLister(total=10, page_size=5)
+    result = srv._collect(lister, lambda r: r, max_results=4)
+    assert result.items == [0, 1, 2, 3]
+    assert result.truncated is True
+    assert lister.calls == 1
+
+
+def test_cap_on_page_boundary_uses_next_page_token():
+    lister = FakeLister(total=10, page_size=2)
+    result = srv._collect(lister, lambda r: r, max_results=4)
+    assert result.items == [0, 1, 2, 3]
+    assert result.truncated is True
+    assert lister.calls == 2
+
+
+def test_cap_equal_to_total_is_not_truncated():
+    lister = FakeLister(total=4, page_size=2)
+    result = srv._collect(lister, lambda r: r, max_results=4)
+    assert result.truncated is False
+    assert lister.calls == 2
+
+
+def test_uncapped_reads_every_page():
+    lister = FakeLister(total=5, page_size=2)
+    result = srv._collect(lister, lambda r: r, max_results=None)
+    assert result.items == [0, 1, 2, 3, 4]
+    assert result.truncated is False
+    assert lister.calls == 3
+
+
+@pytest.mark.parametrize("max_results", [0, -5])
+def test_non_positive_cap_is_rejected_without_calls(max_results):
+    lister = FakeLister(total=10, page_size=5)
+    with pytest.raises(ValueError):
+        srv._collect(lister, lambda r: r, max_results=max_results)
+    assert lister.calls == 0
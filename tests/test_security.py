@@ -0,0 +1,17 @@
+import pytest
+
+import oci_mcp_server as srv
+
+
+@pytest.mark.parametrize("source, wide", [
+    ("0.0.0.0/0", True),
+    ("0.0.0.0/1", True),
+    ("::/0", True),
+    ("10.0.0.0/8", False),
+    ("10.0.0.0/16", False),
+    ("ocid1.networksecuritygroup.oc1..aaaa", False),
+    ("all-iad-services-in-oracle-services-network", False),
+    (None, False),
+])
+def test_is_wide(source, wide):
+    assert srv._is_wide(source) is wide